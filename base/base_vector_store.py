@@ -13,14 +13,67 @@ from milvus_model.sparse.splade import SpladeEmbeddingFunction
 # Component
 from ..types import FundamentalField
 from llama_index.core.schema import (BaseNode,
+                                     NodeRelationship,
                                      NodeWithScore,
+                                     RelatedNodeInfo,
                                      TextNode)
 from langchain_core.documents.base import Document
 # Import
 import uuid, scipy
+import numpy as np
 
 # List all default keys
 default_keys = list(FundamentalField.model_fields.keys())
+# Bind default keys to constants for hot loops
+_ID_KEY, _EMB_KEY, _SPARSE_KEY, _TYPE_KEY = default_keys[0], default_keys[1], default_keys[2], default_keys[3]
+# Fields of LlamaIndex TextNode and Langchain Document
+_BASE_NODE_FIELDS = list(TextNode.model_fields.keys())
+_DOCUMENT_FIELDS = list(Document.model_fields.keys())
+# Supported dense vector datatypes
+_DENSE_DATATYPES = {"FLOAT_VECTOR": DataType.FLOAT_VECTOR,
+                    "FLOAT16_VECTOR": DataType.FLOAT16_VECTOR,
+                    "BFLOAT16_VECTOR": DataType.BFLOAT16_VECTOR}
+# Default build params of each dense index type
+_DEFAULT_INDEX_PARAMS = {"FLAT": {},
+                         "IVF_FLAT": {"nlist": 128},
+                         "IVF_SQ8": {"nlist": 128},
+                         "IVF_PQ": {"nlist": 1024, "m": 16, "nbits": 8},
+                         "HNSW": {"M": 16, "efConstruction": 200},
+                         "SCANN": {"nlist": 128, "with_raw_data": True}}
+# Default search params of each dense index type
+_DEFAULT_SEARCH_PARAMS = {"FLAT": {},
+                          "IVF_FLAT": {"nprobe": 10},
+                          "IVF_SQ8": {"nprobe": 10},
+                          "IVF_PQ": {"nprobe": 10},
+                          "HNSW": {"ef": 64},
+                          "SCANN": {"nprobe": 10}}
+# Schema of BaseNode fields: (field name, datatype, additional params)
+_BASE_NODE_FIELD_SPECS = (
+    # metadata field
+    (_BASE_NODE_FIELDS[2], DataType.JSON, {}),
+    # excluded_embed_metadata_keys field
+    (_BASE_NODE_FIELDS[3], DataType.ARRAY, {"element_type": DataType.VARCHAR, "max_capacity": 16, "max_length": 64}),
+    # excluded_llm_metadata_keys field
+    (_BASE_NODE_FIELDS[4], DataType.ARRAY, {"element_type": DataType.VARCHAR, "max_capacity": 16, "max_length": 64}),
+    # relationships field
+    (_BASE_NODE_FIELDS[5], DataType.JSON, {}),
+    # metadata_template field
+    (_BASE_NODE_FIELDS[6], DataType.VARCHAR, {"max_length": 32}),
+    # metadata_separator field
+    (_BASE_NODE_FIELDS[7], DataType.VARCHAR, {"max_length": 8}),
+    # text field
+    (_BASE_NODE_FIELDS[8], DataType.VARCHAR, {"max_length": 16384}),
+    # mimetype field
+    (_BASE_NODE_FIELDS[9], DataType.VARCHAR, {"max_length": 16}),
+    # start_char_idx field
+    (_BASE_NODE_FIELDS[10], DataType.INT64, {"max_length": 8, "nullable": True}),
+    # end_char_idx field
+    (_BASE_NODE_FIELDS[11], DataType.INT64, {"max_length": 8, "nullable": True}),
+    # metadata_seperator field
+    (_BASE_NODE_FIELDS[12], DataType.VARCHAR, {"max_length": 8}),
+    # text_template field
+    (_BASE_NODE_FIELDS[13], DataType.VARCHAR, {"max_length": 64}),
+)
 # DataType
 Embedding = List[float]
 
@@ -35,6 +88,8 @@ class BaseVectorStore(MilvusClient):
                  dense_search_metrics: Literal["COSINE", "L2", "IP", "HAMMING", "JACCARD"] = "COSINE",
                  index_algo :Literal["FLAT","IVF_FLAT","IVF_SQ8","IVF_PQ","HNSW","SCANN"] = "IVF_FLAT",
                  dense_datatype :Literal["FLOAT_VECTOR","FLOAT16_VECTOR","BFLOAT16_VECTOR"] = "FLOAT_VECTOR",
+                 index_config :Optional[dict] = None,
+                 search_config :Optional[dict] = None,
                  **kwargs):
         super().__init__(uri = uri,
                          user = user,
@@ -49,13 +104,16 @@ class BaseVectorStore(MilvusClient):
         self._index_algo = index_algo
         self._dense_datatype = dense_datatype
         self._uri = uri
+        # Index and search params (Default params of index_algo when None)
+        self._index_config = index_config
+        self._search_config = search_config
 
     @staticmethod
     def _embed_texts(texts: list[str],
                      embedding_model: Union[BaseEmbedding,Embeddings],
                      batch_size: int,
                      num_workers: int,
-                     show_progress: bool = True) -> List[Embedding]:
+                     show_progress: bool = True) -> np.ndarray:
         """
         Get dense representation vector of incoming document contents.
         :param texts: List of input text
@@ -63,38 +121,81 @@ class BaseVectorStore(MilvusClient):
         :param batch_size: The desired batch size
         :param num_workers: The desired num workers
         :param show_progress: Indicate show progress or not
-        :return: List[Embedding]
+        :return: Contiguous float32 array with shape (len(texts), dim)
         """
+        # Sort texts by length so each batch holds similar lengths (less padding)
+        order = sorted(range(len(texts)), key = lambda i: len(texts[i]))
+        sorted_texts = [texts[i] for i in order]
+
         # Base Embedding encode text
         if isinstance(embedding_model, BaseEmbedding):
             # Set batch size and num workers
             embedding_model.num_workers = num_workers
             embedding_model.embed_batch_size = batch_size
-            # Return embedding
-            return embedding_model.get_text_embedding_batch(texts = texts,
-                                                            show_progress = show_progress)
-        # Langchain Embeddings
-        embedding_model :Embeddings
-        return embedding_model.embed_documents(texts = texts)
+            sorted_embeddings = embedding_model.get_text_embedding_batch(texts = sorted_texts,
+                                                                         show_progress = show_progress)
+        else:
+            # Langchain Embeddings
+            embedding_model :Embeddings
+            sorted_embeddings = embedding_model.embed_documents(texts = sorted_texts)
+
+        # Pack into a single buffer and restore the original order
+        sorted_embeddings = np.asarray(sorted_embeddings, dtype = np.float32)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings
 
     @staticmethod
     def _embed_query(queries: Union[str,List[str]],
-                     embedding_model: Union[BaseEmbedding, Embeddings]) -> List[Embedding]:
+                     embedding_model: Union[BaseEmbedding, Embeddings],
+                     batch_queries: bool = False) -> List[Embedding]:
         """
         Get dense representation vector of input query.
         :param query: The query text input
         :param embedding_model: The dense embedding model
+        :param batch_queries: Embed multiple queries with a single batched document call. Only suitable for models
+        that encode queries and documents the same way (no query instruction/prefix).
         :return:
         """
         # Convert string to list of string
         if isinstance(queries,str): queries = [queries]
 
+        # Embed all queries at once
+        if batch_queries and len(queries) > 1:
+            if isinstance(embedding_model, BaseEmbedding):
+                return embedding_model.get_text_embedding_batch(texts = queries,
+                                                                show_progress = False)
+            return embedding_model.embed_documents(texts = queries)
+
         # Get query representation from Llama Index BaseEmbedding model
         if isinstance(embedding_model, BaseEmbedding):
             return [embedding_model.get_query_embedding(query = query) for query in queries]
         # Get query representation from Langchain Embeddings model
         return [embedding_model.embed_query(text = query) for query in queries]
 
+    @staticmethod
+    def _convert_dense_embeddings(embeddings: Union[List[Embedding],np.ndarray],
+                                  dense_datatype: Literal["FLOAT_VECTOR","FLOAT16_VECTOR","BFLOAT16_VECTOR"] = "FLOAT_VECTOR") -> Union[List[Embedding],np.ndarray]:
+        """
+        Cast dense embeddings to the precision of the dense vector field (half precision halves the stored bytes).
+        :param embeddings: List or array of dense embeddings
+        :param dense_datatype: Datatype of dense vector field (FLOAT_VECTOR, FLOAT16_VECTOR, BFLOAT16_VECTOR)
+        :return: Union[List[Embedding],np.ndarray] (unchanged for FLOAT_VECTOR, list of casted rows otherwise)
+        """
+        # Full precision is accepted as it is
+        if dense_datatype == "FLOAT_VECTOR":
+            return embeddings
+        elif dense_datatype == "FLOAT16_VECTOR":
+            return list(np.asarray(embeddings, dtype = np.float16))
+        elif dense_datatype == "BFLOAT16_VECTOR":
+            # Numpy doesnt provide bfloat16
+            try:
+                from ml_dtypes import bfloat16
+            except ImportError:
+                raise ImportError("Please install ml_dtypes for using BFLOAT16_VECTOR: pip install ml_dtypes")
+            return list(np.asarray(embeddings, dtype = np.float32).astype(bfloat16))
+        raise ValueError(f"Dense data type: {dense_datatype} is not compatible with dense vector field!")
+
     @staticmethod
     def _sparse_embed_texts(texts: list[str],
                             sparse_embedding_model: Union[SparseTextEmbedding, SpladeEmbeddingFunction],
@@ -118,19 +219,19 @@ class BaseVectorStore(MilvusClient):
         elif isinstance(sparse_embedding_model,SpladeEmbeddingFunction):
             # Splade Embedding
             sparse_embeddings = sparse_embedding_model.encode_documents(documents = texts)
-            return [BaseVectorStore._convert_csr_array_to_dict(embedding) for embedding in sparse_embeddings]
+            return BaseVectorStore._convert_csr_matrix_to_dicts(sparse_embeddings)
         # Doesnt support
         raise NotImplementedError("This version only support FastEmbed SparseTextEmbedding!")
 
     @staticmethod
     def _sparse_embed_query(query: Union[str,List[str]],
-                            sparse_embedding_model: SparseTextEmbedding) -> List[dict]:
+                            sparse_embedding_model: Union[SparseTextEmbedding, SpladeEmbeddingFunction]) -> Union[List[dict],scipy.sparse.csr_array]:
         """
         Get sparse representation of incoming query.
         :param query: The incoming query
         :param sparse_embedding_model: The sparse embedding model
-        :return: List of dictionary with indices and values
-        :rtype: List[dict]
+        :return: List of dictionary with indices and values (Fastembed) or csr array with one row per query (Milvus)
+        :rtype: Union[List[dict],scipy.sparse.csr_array]
         """
         # Convert string to list of string
         if isinstance(query,str): query = [query]
@@ -144,8 +245,8 @@ class BaseVectorStore(MilvusClient):
         elif isinstance(sparse_embedding_model, SpladeEmbeddingFunction):
             # Milvus Sparse embedding
             sparse_embeddings = sparse_embedding_model.encode_queries(queries = query)
-            # Normalize
-            return [BaseVectorStore._convert_csr_array_to_dict(embedding) for embedding in sparse_embeddings]
+            # Pymilvus accepts scipy sparse matrix as search data, no need to convert to dictionary
+            return sparse_embeddings
         # Doesnt support
         raise NotImplementedError("Sparse embedding currently support Milvus/Fastembed!")
 
@@ -158,32 +259,28 @@ class BaseVectorStore(MilvusClient):
         """
         # Check document type
         if isinstance(documents[0],BaseNode):
-            # Clear private data from payload
-            for i in range(len(documents)):
-                documents[i].embedding = None
+            # Clear private data and serialize in a single pass
+            payloads = []
+            for document in documents:
+                document.embedding = None
                 # Pop file path
-                if documents[i].metadata.get("file_path"):
-                    documents[i].metadata.pop("file_path")
-                # documents[i].excluded_embed_metadata_keys = []
-                # documents[i].excluded_llm_metadata_keys = []
+                document.metadata.pop("file_path", None)
                 # Remove metadata in relationship
-                for key in documents[i].relationships.keys():
-                    documents[i].relationships[key].metadata = {}
-
-            return [document.dict() for document in documents]
-        else:
-            # Langchain Document verify
-            documents = [document.dict() for document in documents]
-            # Add id_ value to dict
-            for i in range(len(documents)):
-                # Get id_
-                document_id = documents[i].get("id")
-                documents[i].update({default_keys[0]: document_id if document_id is not None else str(uuid.uuid4()),
-                                     default_keys[3]: documents[i].get("type")})
-                # Drop key
-                documents[i].pop("id")
-                documents[i].pop("type")
-            return documents
+                for relationship in document.relationships.values():
+                    relationship.metadata = {}
+                payloads.append(document.dict())
+            return payloads
+
+        # Langchain Document verify
+        payloads = []
+        for document in documents:
+            payload = document.dict()
+            # Move id and type to the default keys
+            document_id = payload.pop("id", None)
+            payload[_ID_KEY] = document_id if document_id is not None else str(uuid.uuid4())
+            payload[_TYPE_KEY] = payload.pop("type")
+            payloads.append(payload)
+        return payloads
 
     @staticmethod
     def _convert_response_to_node_with_score(responses: List[dict],
@@ -194,22 +291,33 @@ class BaseVectorStore(MilvusClient):
         :param remove_embedding: Specify whether remove embedding from output or not
         :return: Sequence[NodeWithScore]
         """
-        # Get node with format
-        results = []
-        for response in responses:
-            # Get the main part
-            temp = dict(response['entity'])
-            # temp.update({"score": response['distance']})
-            # Remove embedding
-            if remove_embedding: temp.update({default_keys[1]:None,
-                                              default_keys[2]:None})
-            results.append(temp)
-
-        # Define text nodes
-        text_nodes = [TextNode.from_dict(result) for result in results]
-        # Return NodeWithScore
-        return [NodeWithScore(node = text_nodes[i],
-                              score = responses[i]["distance"]) for i in range(len(responses))]
+        # Build NodeWithScore in a single pass
+        if remove_embedding:
+            return [NodeWithScore(node = BaseVectorStore._construct_text_node(response['entity'], embedding = None),
+                                  score = response["distance"]) for response in responses]
+        return [NodeWithScore(node = BaseVectorStore._construct_text_node(response['entity']),
+                              score = response["distance"]) for response in responses]
+
+    @staticmethod
+    def _construct_text_node(entity: dict,
+                             **kwargs) -> TextNode:
+        """
+        Construct TextNode from collection entity without validation (entity follows the collection schema).
+        Only relationships are parsed, since they are stored as JSON.
+        :param entity: The entity from searching response
+        :param kwargs: Fields to override
+        :return: TextNode
+        """
+        # Keep TextNode fields only
+        fields = {key: entity[key] for key in _BASE_NODE_FIELDS if key in entity}
+        fields.update(kwargs)
+        # Parse relationships
+        relationships = fields.get(_BASE_NODE_FIELDS[5])
+        if relationships:
+            fields[_BASE_NODE_FIELDS[5]] = {NodeRelationship(key): [RelatedNodeInfo.from_dict(info) for info in value]
+                                            if isinstance(value, list) else RelatedNodeInfo.from_dict(value)
+                                            for key, value in relationships.items()}
+        return TextNode.model_construct(**fields)
 
     @staticmethod
     def _convert_response_to_document(responses: List[dict],
@@ -217,32 +325,34 @@ class BaseVectorStore(MilvusClient):
         """
         Convert response to Langchain Document format
         :param responses: Response for converting
-        :param remove_embedding: Specify whether remove embedding from output or not
+        :param remove_embedding: Specify whether remove embedding from output or not (Document has no embedding field)
         :return: Sequence[Document]
         """
         # Get node with format
         results = []
         for response in responses:
-            # Get the main part
-            entity = dict(response['entity'])
-            # Remove embedding
-            if remove_embedding: entity.update({default_keys[1]:None,
-                                                default_keys[2]:None})
+            # Keep Document fields only (embeddings are never part of Document)
+            entity = response['entity']
+            fields = {key: entity[key] for key in _DOCUMENT_FIELDS if key in entity}
             # Add score to metadata
-            entity.setdefault("metadata",{}).setdefault("score",response.get("distance"))
-            # Append Document object to final results
-            results.append(Document.parse_obj(entity))
+            fields.setdefault("metadata",{}).setdefault("score",response.get("distance"))
+            # Append Document object to final results (entity follows the collection schema, skip validation)
+            results.append(Document.model_construct(**fields))
         # Return Document
         return results
 
     @staticmethod
-    def _convert_csr_array_to_dict(csr_array :scipy.sparse.csr_array) -> dict:
+    def _convert_csr_matrix_to_dicts(csr_matrix :scipy.sparse.csr_array) -> List[dict]:
         """
-        Convert csr array (From Milvus Sparse Embedding) to base dictionary format
-        :param csr_array: Spicy csr array for converting
-        :return: dict
+        Convert every row of a csr matrix (From Milvus Sparse Embedding) to base dictionary format
+        :param csr_matrix: Spicy csr matrix with one row per document
+        :return: List[dict]
         """
-        return {indice:value for (indice, value) in zip(csr_array.indices,csr_array.data)}
+        # Materialize native int keys and float values once for the whole matrix
+        indices, data = csr_matrix.indices.tolist(), csr_matrix.data.tolist()
+        indptr = csr_matrix.indptr.tolist()
+        # Slice the shared indices/data lists with row pointers
+        return [dict(zip(indices[start:end], data[start:end])) for start, end in zip(indptr, indptr[1:])]
 
     def _setup_collection_schema(self,
                                  document_type: str,
@@ -269,99 +379,39 @@ class BaseVectorStore(MilvusClient):
 
         # Add default field
         # id_ field
-        schema.add_field(field_name = default_keys[0],
+        schema.add_field(field_name = _ID_KEY,
                          datatype = DataType.VARCHAR,
                          is_primary = True,
                          max_length = 64)
         # embedding field
-        schema.add_field(field_name = default_keys[1],
+        schema.add_field(field_name = _EMB_KEY,
                          datatype = dense_datatype,
                          dim = vector_dims)
         if enable_sparse:
             # Add sparse field
-            schema.add_field(field_name = default_keys[2],
+            schema.add_field(field_name = _SPARSE_KEY,
                              datatype = DataType.SPARSE_FLOAT_VECTOR)
 
         # document type field
-        schema.add_field(field_name = default_keys[3],
+        schema.add_field(field_name = _TYPE_KEY,
                          datatype = DataType.VARCHAR,
                          max_length = 16)
 
         # For both BaseNode and ImageNode
         if document_type.endswith("Node"):
-            # BaseNode fields
-            base_node_fields = list(TextNode.model_fields.keys())
-
             # Add fields
-            # Metadata field
-            schema.add_field(field_name = base_node_fields[2],
-                             datatype = DataType.JSON)
-            # excluded_embed_metadata_keys field
-            schema.add_field(field_name = base_node_fields[3],
-                             datatype = DataType.ARRAY,
-                             element_type = DataType.VARCHAR,
-                             max_capacity = 16,
-                             max_length = 64)
-
-            # excluded_llm_metadata_keys
-            schema.add_field(field_name = base_node_fields[4],
-                             datatype = DataType.ARRAY,
-                             element_type = DataType.VARCHAR,
-                             max_capacity = 16,
-                             max_length = 64)
-
-            # relationships field
-            schema.add_field(field_name = base_node_fields[5],
-                             datatype = DataType.JSON)
-
-            # metadata_template field
-            schema.add_field(field_name = base_node_fields[6],
-                             datatype = DataType.VARCHAR,
-                             max_length = 32)
-
-            # metadata_separator field
-            schema.add_field(field_name = base_node_fields[7],
-                             datatype = DataType.VARCHAR,
-                             max_length = 8)
-            # text field
-            schema.add_field(field_name = base_node_fields[8],
-                             datatype = DataType.VARCHAR,
-                             max_length = 16384)
-
-            # mimetype field
-            schema.add_field(field_name = base_node_fields[9],
-                             datatype = DataType.VARCHAR,
-                             max_length = 16)
-
-            # start_char_idx field
-            schema.add_field(field_name = base_node_fields[10],
-                             datatype = DataType.INT64,
-                             max_length = 8,
-                             nullable = True)
-            # end_char_idx
-            schema.add_field(field_name = base_node_fields[11],
-                             datatype = DataType.INT64,
-                             max_length = 8,
-                             nullable = True)
-
-            # metadata_seperator field
-            schema.add_field(field_name = base_node_fields[12],
-                             datatype = DataType.VARCHAR,
-                             max_length = 8)
-
-            # text_template field
-            schema.add_field(field_name = base_node_fields[13],
-                             datatype = DataType.VARCHAR,
-                             max_length = 64)
+            for field_name, datatype, field_params in _BASE_NODE_FIELD_SPECS:
+                schema.add_field(field_name = field_name,
+                                 datatype = datatype,
+                                 **field_params)
 
         elif document_type == "Document":
-            document_fields = list(Document.model_fields.keys())
             # Add fields
             # Metadata field
-            schema.add_field(field_name = document_fields[1],
+            schema.add_field(field_name = _DOCUMENT_FIELDS[1],
                              datatype = DataType.JSON)
             # page content field
-            schema.add_field(field_name = document_fields[2],
+            schema.add_field(field_name = _DOCUMENT_FIELDS[2],
                              datatype = DataType.VARCHAR,
                              max_length = 16384)
         return schema
@@ -370,6 +420,7 @@ class BaseVectorStore(MilvusClient):
                                 index_algo :Literal["FLAT","IVF_FLAT","IVF_SQ8","IVF_PQ","HNSW","SCANN"] = "IVF_FLAT",
                                 dense_search_metric :Literal["COSINE","L2","IP","HAMMING","JACCARD"] = "COSINE",
                                 params :Optional[dict] = None,
+                                vector_dims :Optional[int] = None,
                                 enable_sparse :bool = False,
                                 sparse_index_type :Literal["SPARSE_INVERTED_INDEX","SPARSE_WAND"] = "SPARSE_INVERTED_INDEX",
                                 sparse_params :Optional[dict] = None,
@@ -379,7 +430,8 @@ class BaseVectorStore(MilvusClient):
         :param index_algo: Name of the algorithm used to arrange data in the specific field ( FLAT,IVF_FLAT,etc).
         :param dense_search_metric: The algorithm that is used to measure similarity between vectors. Possible values are
         IP, L2, COSINE, JACCARD, HAMMING (For dense representation).
-        :param params: The fine-tuning parameters for the specified dense index type.
+        :param params: The fine-tuning parameters for the specified dense index type. Default depends on index_algo.
+        :param vector_dims: The dimension of vector (for verifying IVF_PQ params)
         :param enable_sparse: Enable the sparse schema or not
         :param sparse_index_type: Index type using with sparse (SPARSE_INVERTED_INDEX ,SPARSE_WAND)
         :param sparse_params:  The fine-tuning parameters for the specified sparse index type.
@@ -387,17 +439,19 @@ class BaseVectorStore(MilvusClient):
         """
         # Define index
         index_params = self.prepare_index_params()
-        # Default dense params
-        if params is None: params = {"nlist": 128}
+        # Dense params (Default depends on index_algo)
+        params = self._get_index_params(index_algo = index_algo,
+                                        params = params,
+                                        vector_dims = vector_dims)
 
         # Default sparse params
         if sparse_params is None: sparse_params = {"drop_ratio_build": 0.2}
 
         # Add id key
-        index_params.add_index(field_name = default_keys[0],
+        index_params.add_index(field_name = _ID_KEY,
                                index_name = "unique_id")
         # Add dense key
-        index_params.add_index(field_name = default_keys[1],
+        index_params.add_index(field_name = _EMB_KEY,
                                index_name = "dense_representation",
                                index_type = index_algo,
                                metric_type = dense_search_metric,
@@ -406,7 +460,7 @@ class BaseVectorStore(MilvusClient):
         # If enable sparse index
         if enable_sparse:
             index_params.add_index(
-                field_name = default_keys[2],
+                field_name = _SPARSE_KEY,
                 index_name = "sparse_representation",
                 index_type = sparse_index_type,
                 metric_type = "IP", # Only Inner Product is used to measure the similarity between 2 sparse vectors.
@@ -434,6 +488,8 @@ class BaseVectorStore(MilvusClient):
         # Define index
         index_params = self._setup_collection_index(index_algo = self._index_algo,
                                                     dense_search_metric = self._dense_search_metrics,
+                                                    params = self._index_config,
+                                                    vector_dims = dimension_nums,
                                                     enable_sparse = enable_sparse)
         # Collection for LlamaIndex payloads
         self.create_collection(collection_name = self._collection_name,
@@ -461,18 +517,52 @@ class BaseVectorStore(MilvusClient):
         # Return state
         return self.get_load_state(collection_name = self._collection_name)
 
+    @staticmethod
+    def _get_index_params(index_algo :str,
+                          params :Optional[dict] = None,
+                          vector_dims :Optional[int] = None) -> dict:
+        """
+        Get the build params of dense index (params or default params of index_algo)
+        :param index_algo: Name of the dense index algorithm
+        :param params: The user defined params
+        :param vector_dims: The dimension of vector
+        :return: dict
+        """
+        if params is not None:
+            params = dict(params)
+        else:
+            params = dict(_DEFAULT_INDEX_PARAMS.get(index_algo, {}))
+            # IVF_PQ requires dim % m == 0, use the largest divisor of dim not above default m
+            if index_algo == "IVF_PQ" and vector_dims:
+                params["m"] = max(m for m in range(1, params["m"] + 1) if vector_dims % m == 0)
+
+        # Verify IVF_PQ params
+        if index_algo == "IVF_PQ" and vector_dims and params.get("m") and vector_dims % params["m"] != 0:
+            raise ValueError(f"IVF_PQ param m ({params['m']}) must divide the vector dimension ({vector_dims})!")
+        return params
+
+    def _get_search_params(self,
+                           limit :int) -> dict:
+        """
+        Get the search params of dense index (search_config or default params of index_algo)
+        :param limit: Number of resulted responses
+        :return: dict
+        """
+        if self._search_config is not None:
+            return dict(self._search_config)
+        params = dict(_DEFAULT_SEARCH_PARAMS.get(self._index_algo, {}))
+        # HNSW requires ef >= limit
+        if self._index_algo == "HNSW":
+            params["ef"] = max(params["ef"], limit)
+        return params
+
     @staticmethod
     def _get_datatype(datatype :str) -> DataType:
         # Define dense datatype
-        if datatype == "FLOAT_VECTOR":
-            datatype = DataType.FLOAT_VECTOR
-        elif datatype == "FLOAT16_VECTOR":
-            datatype = DataType.FLOAT16_VECTOR
-        elif datatype == "BFLOAT16_VECTOR":
-            datatype = DataType.BFLOAT16_VECTOR
-        else:
+        try:
+            return _DENSE_DATATYPES[datatype]
+        except KeyError:
             raise ValueError(f"Dense data type: {datatype} is not compatible with dense vector field!")
-        return datatype
 
     def retrieve(self,
                  query: str,
@@ -520,7 +610,7 @@ class BaseVectorStore(MilvusClient):
                                      collection_name :str,
                                      embedding_dimension :int) -> None:
         """
-        Verify config of dense representation index
+        Verify config of dense representation index (dimension and datatype)
         :param collection_name: The collection name
         :param embedding_dimension: Embedding dimension
         :return: None
@@ -529,20 +619,25 @@ class BaseVectorStore(MilvusClient):
         stats = self.describe_collection(collection_name = collection_name)
 
         # Embedding stats
-        collection_stats = dict(stats).get("fields")
-        if collection_stats is None:
+        collection_fields = stats.get("fields")
+        if collection_fields is None:
             raise ValueError("Fields not existed in collection")
         # Stats
-        collection_stats = [stats for stats in collection_stats if dict(stats).get("name") == default_keys[1]]
-        if len(collection_stats) == 0:
+        embedding_field = next((field for field in collection_fields if field.get("name") == _EMB_KEY), None)
+        if embedding_field is None:
             raise ValueError("Empty embedding field!")
 
+        # Check datatype
+        collection_datatype = embedding_field.get("type")
+        if collection_datatype is not None and collection_datatype != self._get_datatype(self._dense_datatype):
+            raise ValueError(f"Dense data type ({self._dense_datatype}) is differ with default collection data type ({collection_datatype})")
+
         # Params
-        collection_params = dict(collection_stats[0]).get("params")
+        collection_params = embedding_field.get("params")
         if collection_params is None:
             raise ValueError("Empty params field!")
         # Dims
-        collection_dims = dict(collection_params).get("dim")
+        collection_dims = collection_params.get("dim")
         if collection_dims is None:
             raise ValueError("Empty dim field!")
 
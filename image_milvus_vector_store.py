@@ -199,7 +199,8 @@ class ImageMilvusVectorStore(BaseVectorStore):
             queries = [queries]
 
         # Search metrics
-        search_metrics = {"metric_type": self._dense_search_metrics}
+        search_metrics = {"metric_type": self._dense_search_metrics,
+                          "params": self._get_search_params(limit = similarity_top_k)}
         # Get collection info
         collection_info = self.collection_info()
         # Get field name from collection
@@ -351,12 +352,18 @@ class ImageMilvusVectorStore(BaseVectorStore):
                                 text_search_metric: Literal["COSINE", "L2", "IP", "HAMMING", "JACCARD"] = "COSINE",
                                 params :Optional[dict] = None,
                                 text_params :Optional[dict] = None,
+                                vector_dims :Optional[int] = None,
+                                text_vector_dims :Optional[int] = None,
                                 **kwargs):
         # Define index
         index_params = self.prepare_index_params()
-        # Default dense params
-        if params is None: params = {"nlist": 128}
-        if text_params is None: params = {"nlist": 128}
+        # Dense params (Default depends on index_algo)
+        params = self._get_index_params(index_algo = index_algo,
+                                        params = params,
+                                        vector_dims = vector_dims)
+        text_params = self._get_index_params(index_algo = index_algo,
+                                             params = text_params,
+                                             vector_dims = text_vector_dims)
 
         image_node_field = list(ImageNode.model_fields.keys())
         # Add id index
@@ -396,7 +403,9 @@ class ImageMilvusVectorStore(BaseVectorStore):
                                                image_datatype = self._dense_datatype)
         # Define index
         index_params = self._setup_collection_index(index_algo = self._index_algo,
-                                                    dense_search_metric = self._dense_search_metrics)
+                                                    dense_search_metric = self._dense_search_metrics,
+                                                    params = self._index_config,
+                                                    vector_dims = dimension_nums)
         # Collection for LlamaIndex payloads
         self.create_collection(collection_name = self._collection_name,
                                schema = schema,
@@ -34,6 +34,10 @@ class MilvusVectorStore(BaseVectorStore):
                  token :str = "",
                  dense_search_metrics :Literal["COSINE","L2","IP","HAMMING","JACCARD"] = "COSINE",
                  index_algo: Literal["FLAT", "IVF_FLAT", "IVF_SQ8", "IVF_PQ", "HNSW", "SCANN"] = "IVF_FLAT",
+                 dense_datatype :Literal["FLOAT_VECTOR","FLOAT16_VECTOR","BFLOAT16_VECTOR"] = "FLOAT_VECTOR",
+                 index_config :Optional[dict] = None,
+                 search_config :Optional[dict] = None,
+                 batch_query_embedding :bool = False,
                  **kwargs) -> None:
 
         """
@@ -56,6 +60,17 @@ class MilvusVectorStore(BaseVectorStore):
         :type dense_search_metrics: str
         :param token: Name of the algorithm used to arrange data in the specific field ( FLAT,IVF_FLAT,etc).
         :type token: str
+        :param dense_datatype: Datatype for storing dense vectors (FLOAT_VECTOR, FLOAT16_VECTOR, BFLOAT16_VECTOR).
+        Half precision halves the index size, BFLOAT16_VECTOR requires ml_dtypes.
+        :type dense_datatype: str
+        :param index_config: Build params of dense index. Default depends on index_algo (e.g. HNSW: M=16,
+        efConstruction=200).
+        :type index_config: Optional[dict]
+        :param search_config: Search params of dense index. Default depends on index_algo (e.g. HNSW: ef=64).
+        :type search_config: Optional[dict]
+        :param batch_query_embedding: Embed a list of queries with a single batched call. Only enable it for models
+        that encode queries and documents the same way.
+        :type batch_query_embedding: bool
         :param kwargs: Additional params
         """
         assert collection_name, "Collection name must be string"
@@ -68,11 +83,16 @@ class MilvusVectorStore(BaseVectorStore):
                          token = token,
                          dense_search_metrics = dense_search_metrics,
                          index_algo = index_algo,
+                         dense_datatype = dense_datatype,
+                         index_config = index_config,
+                         search_config = search_config,
                          **kwargs)
         # Dense model
         self._dense_embedding_model = dense_embedding_model
         # Sparse model
         self._sparse_embedding_model = sparse_embedding_model
+        # Batch query embedding
+        self._batch_query_embedding = batch_query_embedding
 
     def insert_documents(self,
                          documents :List[Union[BaseNode,Document]],
@@ -106,9 +126,6 @@ class MilvusVectorStore(BaseVectorStore):
         # Get document type
         document_type = "BaseNode" if isinstance(documents[0],BaseNode) else "Document"
 
-        # Convert BaseNode to Dict and remove redundant information
-        nodes = self._convert_upsert_data(documents = documents)
-
         # Get content
         if isinstance(documents[0], BaseNode):
             # LlamaIndex BaseNode case
@@ -122,21 +139,21 @@ class MilvusVectorStore(BaseVectorStore):
                                              embedding_model = self._dense_embedding_model,
                                              batch_size = dense_batch_size,
                                              num_workers = dense_num_workers)
-        # Update dense embedding to node
-        for i in range(len(nodes)): nodes[i].update({default_keys[1]: dense_embeddings[i]})
+        # Cast to the precision of dense field
+        dense_embeddings = self._convert_dense_embeddings(embeddings = dense_embeddings,
+                                                          dense_datatype = self._dense_datatype)
 
         # When enable sparse
+        sparse_embeddings = None
         if self._sparse_embedding_model is not None:
             # Embed sparse embedding
             sparse_embeddings = self._sparse_embed_texts(texts = contents,
                                                          sparse_embedding_model = self._sparse_embedding_model,
                                                          batch_size = sparse_batch_size,
                                                          parallel = sparse_parralel)
-            # Add sparse embedding to dictionary
-            for i in range(len(nodes)): nodes[i].update({default_keys[2]: sparse_embeddings[i]})
 
         # Get dimension nums
-        dimension_nums = len(nodes[0][default_keys[1]])
+        dimension_nums = len(dense_embeddings[0])
 
         # Check collection existence
         if not self.has_collection(collection_name = self._collection_name):
@@ -157,12 +174,20 @@ class MilvusVectorStore(BaseVectorStore):
             # Create partition
             self._create_partition(partition_name = partition_name)
 
-        # Iterate over the data with batch
-        for i in range(0, len(nodes), uploading_batch_size):
+        # Embedding keys
+        embedding_key, sparse_embedding_key = default_keys[1], default_keys[2]
+        # Iterate over the data with batch (payloads are built per batch to keep peak memory low)
+        for i in range(0, len(documents), uploading_batch_size):
+            # Convert BaseNode to Dict and remove redundant information
+            nodes = self._convert_upsert_data(documents = documents[i:i + uploading_batch_size])
+            # Add embeddings to dictionary
+            for j, node in enumerate(nodes, start = i):
+                node[embedding_key] = dense_embeddings[j]
+                if sparse_embeddings is not None: node[sparse_embedding_key] = sparse_embeddings[j]
             # Insert to partition inside collection
             res = self.insert(collection_name = self._collection_name,
                               partition_name = partition_name,
-                              data = nodes[i:i + uploading_batch_size],
+                              data = nodes,
                               **kwargs)
 
     def retrieve(self,
@@ -210,12 +235,17 @@ class MilvusVectorStore(BaseVectorStore):
         collection_fields = [field["name"] for field in collection_info["fields"]]
 
         # Search metrics
-        search_metrics = {"metric_type": self._dense_search_metrics}
+        search_metrics = {"metric_type": self._dense_search_metrics,
+                          "params": self._get_search_params(limit = similarity_top_k)}
         # Search with dense embedding
         if mode == "dense":
             # Get dense query embedding
             query_embedding = self._embed_query(queries = query,
-                                                embedding_model = self._dense_embedding_model)
+                                                embedding_model = self._dense_embedding_model,
+                                                batch_queries = self._batch_query_embedding)
+            # Cast to the precision of dense field
+            query_embedding = self._convert_dense_embeddings(embeddings = query_embedding,
+                                                             dense_datatype = self._dense_datatype)
             # Verify embedding size
             self._verify_collection_dimension(collection_name = self._collection_name,
                                               embedding_dimension = len(query_embedding[0]))
@@ -233,7 +263,8 @@ class MilvusVectorStore(BaseVectorStore):
             # Sparse anns fields
             anns_field = default_keys[2]
             # Change metric type for sparse searching
-            search_metrics.update({"metric_type": "IP"})
+            search_metrics.update({"metric_type": "IP",
+                                   "params": {}})
 
         # Get the retrieved text
         results = self.search(collection_name = self._collection_name,
@@ -270,7 +301,7 @@ class MilvusVectorStore(BaseVectorStore):
         :param dense_similarity_top_k: Number of dense responses from searching.
         :param sparse_similarity_top_k: Number of sparse responses from searching.
         :param rerank_similarity_top_k: Number of resulted responses after reranking.
-        :param dense_params: Optional parameter for dense retrieval
+        :param dense_params: Optional parameter for dense retrieval. Default is search_config of vector store.
         :param sparse_params: Optional parameter for sparse retrieval
         :param return_type: return_type: Desired object for return (BasePoint or auto)
         :param kwargs: Additional params
@@ -300,7 +331,11 @@ class MilvusVectorStore(BaseVectorStore):
 
         # Get dense query embedding
         query_dense_vector = self._embed_query(query,
-                                               embedding_model = self._dense_embedding_model)
+                                               embedding_model = self._dense_embedding_model,
+                                               batch_queries = self._batch_query_embedding)
+        # Cast to the precision of dense field
+        query_dense_vector = self._convert_dense_embeddings(embeddings = query_dense_vector,
+                                                            dense_datatype = self._dense_datatype)
         # Get sparse query embedding
         query_sparse_vector = self._sparse_embed_query(query = query,
                                                        sparse_embedding_model = self._sparse_embedding_model)
@@ -311,7 +346,7 @@ class MilvusVectorStore(BaseVectorStore):
             "anns_field": default_keys[1],
             "param": {
                 "metric_type": self._dense_search_metrics,
-                "params": {"nprobe": 10} if dense_params is None else dense_params
+                "params": self._get_search_params(limit = dense_similarity_top_k) if dense_params is None else dense_params
             },
             "limit": dense_similarity_top_k
         }